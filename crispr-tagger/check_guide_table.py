@@ -0,0 +1,84 @@
+# check_guide_table.py
+# Quick round-trip checks for GuideTable / merge_crispor: python check_guide_table.py
+import contextlib
+import io
+import os
+import tempfile
+import numpy as np
+from guide_table import GuideTable, pack_seqs, unpack_seqs
+from merge_crispor import merge_crispor, read_guides_csv
+
+RECORDS = [
+    {"seq20": "GACAGCCTTGTAATTTGTGC", "pam": "TGG", "strand": "+", "cut_genomic": 18628762, "distance": 7},
+    {"seq20": "GCCTTGTAATTTGTGCTGGT", "pam": "AGG", "strand": "+", "cut_genomic": 18628766, "distance": 11},
+    {"seq20": "CCCTACCAGCACAAATTACA", "pam": "AGG", "strand": "-", "cut_genomic": 18628753, "distance": 2},
+    {"seq20": "CCTTGTAATTTGTGCTGGTA", "pam": "GGG", "strand": "+", "cut_genomic": 18628767, "distance": 12},
+    {"seq20": "CTTGTAATTTGTGCTGGTAG", "pam": "GGG", "strand": "+", "cut_genomic": 18628768, "distance": 13},
+]
+
+def expect_error(exc, fn, *args):
+    try:
+        fn(*args)
+    except exc:
+        return
+    raise AssertionError(f"{fn.__name__}{args} did not raise {exc.__name__}")
+
+def check_packing():
+    seqs = ["ACGT" * 5, "TTTTGGGGCCCCAAAAACGT", "A" * 20, "T" * 20]
+    assert unpack_seqs(pack_seqs(seqs, 20), 20).tolist() == seqs
+    assert unpack_seqs(pack_seqs(["TGG", "CCA"], 3), 3).tolist() == ["TGG", "CCA"]
+    expect_error(ValueError, pack_seqs, ["A" * 19, "A" * 21], 20)  # total length matches, rows don't
+    expect_error(ValueError, pack_seqs, ["N" * 20], 20)
+
+def check_table():
+    t = GuideTable.from_records(RECORDS)
+    assert t.to_records() == RECORDS
+    assert len(GuideTable.empty()) == 0 and GuideTable.empty().to_records() == []
+    assert len(t[0]) == 1 and t[-1].to_records() == RECORDS[-1:]
+    assert t.sort_by("distance")["distance"].tolist() == [2, 7, 11, 12, 13]
+    assert t.sort_by("distance", descending=True)["distance"].tolist() == [13, 12, 11, 7, 2]
+    assert t.filter(t["strand"] < 0)["cut_genomic"].tolist() == [18628753]
+    expect_error(ValueError, t.sort_by, "seq20")
+    bad = [dict(RECORDS[0], strand="1")]
+    expect_error(ValueError, GuideTable.from_records, bad)
+
+def check_merge():
+    t = GuideTable.from_records(RECORDS)
+    with tempfile.TemporaryDirectory() as d:
+        tsv = os.path.join(d, "crispor.tsv")
+        with open(tsv, "w") as fh:
+            fh.write("targetSeq\tDoench 2016\tOff-targets (0-1 mismatches)\n")
+            fh.write(f"{RECORDS[0]['seq20'].lower()}\t61.123456789\t1\n")  # self-hit
+            fh.write(f"{RECORDS[1]['seq20']}\t5\t0\n")                      # low efficiency
+            fh.write(f"{RECORDS[2]['seq20']}\t40\t3\n")                     # off-targets
+            fh.write(f"{RECORDS[3]['seq20']}\t30\t\n")                      # blank off-target cell
+            # RECORDS[4] has no CRISPOR row → NaN from the left join
+        scored_csv = os.path.join(d, "scored.csv")
+        with contextlib.redirect_stdout(io.StringIO()):
+            scored, kept = merge_crispor(t, tsv, scored_csv, os.path.join(d, "kept.csv"))
+        assert scored["efficiency"][:4].tolist() == [61.123456789, 5.0, 40.0, 30.0]
+        assert np.isnan(scored["efficiency"][4])
+        assert scored["off_le1mm"][:3].tolist() == [0.0, 0.0, 3.0]
+        assert np.isnan(scored["off_le1mm"][3:]).all()
+        assert scored["flag_selfhit"].tolist() == [True, False, False, False, False]
+        assert [r["seq20"] for r in kept.to_records()] == [RECORDS[i]["seq20"] for i in (0, 3, 4)]
+        assert "61.123456789" in open(scored_csv).read()
+
+        # CLI path: aliased sequence column round-trips through read_guides_csv
+        guides_csv = os.path.join(d, "guides.csv")
+        t.to_pandas().rename(columns={"seq20": "Spacer"}).to_csv(guides_csv, index=False)
+        assert read_guides_csv(guides_csv).to_records() == RECORDS
+        assert np.array_equal(read_guides_csv(scored_csv)["efficiency"], scored["efficiency"], equal_nan=True)
+
+        # blank coordinates are rejected, not cast to INT32_MIN
+        df = t.to_pandas()
+        df["cut_genomic"] = df["cut_genomic"].astype(float)
+        df.loc[1, "cut_genomic"] = np.nan
+        df.to_csv(guides_csv, index=False)
+        expect_error(ValueError, read_guides_csv, guides_csv)
+
+if __name__ == "__main__":
+    check_packing()
+    check_table()
+    check_merge()
+    print("GuideTable checks passed.")
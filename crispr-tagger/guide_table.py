@@ -0,0 +1,254 @@
+# guide_table.py
+import numpy as np
+
+# 2-bit base codes; protospacers pack 20 nt into one uint64 (first base in the high bits)
+BASES = b"ACGT"
+SPACER_LEN = 20
+PAM_LEN = 3
+
+_CODE = np.full(256, 255, dtype=np.uint8)
+for _i, _b in enumerate(BASES):
+    _CODE[_b] = _i
+    _CODE[ord(chr(_b).lower())] = _i
+_BASE = np.frombuffer(BASES, dtype=np.uint8)
+
+# column name -> dtype; score columns only exist once CRISPOR results are merged in
+GUIDE_COLUMNS = {
+    "seq20": np.uint64,
+    "pam": np.uint8,
+    "strand": np.int8,
+    "cut_genomic": np.int32,
+    "distance": np.int32,
+}
+SCORE_COLUMNS = {
+    "efficiency": np.float64,
+    "off_le1mm": np.float64,
+    "flag_selfhit": np.bool_,
+}
+SORTABLE_COLUMNS = ("cut_genomic", "distance", "efficiency", "off_le1mm")
+
+
+def pack_seqs(seqs, length: int) -> np.ndarray:
+    """Pack equal-length ACGT strings into uint64 codes (2 bits per base)."""
+    seqs = list(seqs)
+    if not seqs:
+        return np.zeros(0, dtype=np.uint64)
+    bad = [s for s in seqs if len(s) != length]
+    if bad:
+        raise ValueError(f"All sequences must be {length} nt long; got {bad[0]!r}")
+    raw = np.frombuffer("".join(seqs).encode("ascii"), dtype=np.uint8)
+    codes = _CODE[raw].reshape(len(seqs), length)
+    if (codes == 255).any():
+        raise ValueError("Sequences may only contain A, C, G or T")
+    shifts = np.arange(2 * (length - 1), -1, -2, dtype=np.uint64)
+    return (codes.astype(np.uint64) << shifts).sum(axis=1, dtype=np.uint64)
+
+
+def unpack_seqs(packed: np.ndarray, length: int) -> np.ndarray:
+    """Inverse of pack_seqs; returns a numpy array of str."""
+    packed = np.asarray(packed, dtype=np.uint64)
+    shifts = np.arange(2 * (length - 1), -1, -2, dtype=np.uint64)
+    codes = ((packed[:, None] >> shifts) & np.uint64(3)).astype(np.uint8)
+    letters = np.ascontiguousarray(_BASE[codes])
+    return letters.view(f"S{length}").ravel().astype(str)
+
+
+class GuideTable:
+    """
+    Columnar sgRNA table: one contiguous NumPy array per column.
+      seq20        uint64   2-bit packed protospacer
+      pam          uint8    2-bit packed PAM
+      strand       int8     +1 / -1
+      cut_genomic  int32    1-based +strand coordinate of the cut
+      distance     int32    |cut - center|
+    After merging CRISPOR scores: efficiency (float64, NaN = missing),
+    off_le1mm (float64, NaN = missing), flag_selfhit (bool).
+    """
+
+    def __init__(self, columns: dict):
+        self._cols = {}
+        for name, dtype in {**GUIDE_COLUMNS, **SCORE_COLUMNS}.items():
+            if name in columns:
+                self._cols[name] = np.ascontiguousarray(columns[name], dtype=dtype)
+        missing = [c for c in GUIDE_COLUMNS if c not in self._cols]
+        if missing:
+            raise KeyError(f"GuideTable is missing columns: {missing}")
+        sizes = {len(a) for a in self._cols.values()}
+        if len(sizes) > 1:
+            raise ValueError(f"GuideTable columns have different lengths: {sorted(sizes)}")
+
+    # --- construction ---
+    @classmethod
+    def empty(cls) -> "GuideTable":
+        return cls({name: np.zeros(0, dtype=dtype) for name, dtype in GUIDE_COLUMNS.items()})
+
+    @classmethod
+    def from_lists(cls, seq20, pam, strand, cut_genomic, distance) -> "GuideTable":
+        """Build from plain Python lists; strand may be '+'/'-' or +1/-1."""
+        return cls({
+            "seq20": pack_seqs(seq20, SPACER_LEN),
+            "pam": pack_seqs(pam, PAM_LEN),
+            "strand": _encode_strand(strand),
+            "cut_genomic": cut_genomic,
+            "distance": distance,
+        })
+
+    @classmethod
+    def from_records(cls, records: list[dict]) -> "GuideTable":
+        """Build from the old list-of-dicts representation."""
+        if not records:
+            return cls.empty()
+        return cls.from_lists(*([r[c] for r in records] for c in GUIDE_COLUMNS))
+
+    @classmethod
+    def from_pandas(cls, df) -> "GuideTable":
+        """Build from a DataFrame with decoded seq20/pam and '+'/'-' strands."""
+        cols = {
+            "seq20": pack_seqs(df["seq20"].astype(str), SPACER_LEN),
+            "pam": pack_seqs(df["pam"].astype(str), PAM_LEN),
+            "strand": _encode_strand(df["strand"].tolist()),
+            "cut_genomic": _int_column(df, "cut_genomic"),
+            "distance": _int_column(df, "distance"),
+        }
+        if "efficiency" in df.columns:
+            import pandas as pd
+            for name in ("efficiency", "off_le1mm"):
+                cols[name] = pd.to_numeric(df[name], errors="coerce").to_numpy(
+                    dtype=np.float64, na_value=np.nan)
+            cols["flag_selfhit"] = df["flag_selfhit"].fillna(False).to_numpy(dtype=bool)
+        return cls(cols)
+
+    @classmethod
+    def read_csv(cls, path: str) -> "GuideTable":
+        import pandas as pd
+        return cls.from_pandas(pd.read_csv(path, dtype={"seq20": str, "pam": str, "strand": str}))
+
+    # --- access ---
+    def __len__(self) -> int:
+        return len(self._cols["seq20"])
+
+    def __getitem__(self, key):
+        """t["distance"] → column array; t[i] / t[mask] / t[indices] → new GuideTable."""
+        if isinstance(key, str):
+            return self._cols[key]
+        if isinstance(key, (int, np.integer)):
+            # keep a one-row table rather than 0-d arrays
+            key = range(len(self))[key]
+            key = slice(key, key + 1)
+        return GuideTable({name: arr[key] for name, arr in self._cols.items()})
+
+    @property
+    def columns(self) -> list[str]:
+        return list(self._cols)
+
+    @property
+    def has_scores(self) -> bool:
+        return "efficiency" in self._cols
+
+    @property
+    def nbytes(self) -> int:
+        return sum(a.nbytes for a in self._cols.values())
+
+    def spacers(self) -> np.ndarray:
+        return unpack_seqs(self._cols["seq20"], SPACER_LEN)
+
+    def pams(self) -> np.ndarray:
+        return unpack_seqs(self._cols["pam"], PAM_LEN)
+
+    def strands(self) -> np.ndarray:
+        return np.where(self._cols["strand"] > 0, "+", "-")
+
+    def with_scores(self, efficiency, off_le1mm, flag_selfhit) -> "GuideTable":
+        return GuideTable({
+            **self._cols,
+            "efficiency": efficiency,
+            "off_le1mm": off_le1mm,
+            "flag_selfhit": flag_selfhit,
+        })
+
+    # --- vectorized selection ---
+    def filter(self, mask) -> "GuideTable":
+        return self[np.asarray(mask, dtype=bool)]
+
+    def sort_by(self, column: str, descending: bool = False) -> "GuideTable":
+        """Stable sort by a numeric column (e.g. 'distance' or 'efficiency'); NaN scores go last."""
+        if column not in SORTABLE_COLUMNS:
+            raise ValueError(f"Can only sort by {SORTABLE_COLUMNS}, not {column!r}")
+        key = self._cols[column]
+        if descending:
+            # int32 → int64 and float64 negate exactly; NaN stays NaN and sorts last
+            key = -key.astype(np.int64) if key.dtype.kind == "i" else -key
+        return self[np.argsort(key, kind="stable")]
+
+    # --- conversion ---
+    def _decoded(self) -> dict:
+        out = {
+            "seq20": self.spacers(),
+            "pam": self.pams(),
+            "strand": self.strands(),
+        }
+        for name, arr in self._cols.items():
+            out.setdefault(name, arr)
+        return out
+
+    def to_records(self) -> list[dict]:
+        cols = self._decoded()
+        return [dict(zip(cols, row)) for row in zip(*(c.tolist() for c in cols.values()))]
+
+    def to_pandas(self):
+        """Numeric columns are handed to pandas without copying; sequences are decoded to str."""
+        import pandas as pd
+        return pd.DataFrame(self._decoded(), copy=False)
+
+    def to_arrow(self):
+        """Numeric columns are wrapped as Arrow buffers without copying; sequences are decoded to str."""
+        try:
+            import pyarrow as pa
+        except ImportError as e:
+            raise ImportError("pyarrow is required for Arrow/Parquet output (pip install pyarrow)") from e
+        return pa.table({name: pa.array(arr) for name, arr in self._decoded().items()})
+
+    # --- writers ---
+    def to_csv(self, path: str):
+        self.to_pandas().to_csv(path, index=False)
+
+    def to_parquet(self, path: str):
+        table = self.to_arrow()
+        import pyarrow.parquet as pq
+        pq.write_table(table, path)
+
+    def to_fasta_for_crispor(self, path: str, chrom: str):
+        cols = self._decoded()
+        with open(path, "w") as fh:
+            for seq, pam, strand, cut in zip(cols["seq20"], cols["pam"], cols["strand"],
+                                             cols["cut_genomic"].tolist()):
+                fh.write(f">{chrom}|cut={cut}|strand={strand}|pam={pam}\n{seq}\n")
+
+    def __repr__(self) -> str:
+        return f"GuideTable({len(self)} guides, columns={self.columns})"
+
+
+def _int_column(df, name: str) -> np.ndarray:
+    """Checked int32 cast: blank, non-numeric or fractional values raise ValueError."""
+    import pandas as pd
+    values = pd.to_numeric(df[name], errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+    bad = np.isnan(values) | (values != np.round(values)) \
+        | (values < np.iinfo(np.int32).min) | (values > np.iinfo(np.int32).max)
+    if bad.any():
+        i = int(np.flatnonzero(bad)[0])
+        raise ValueError(f"Column {name!r} must hold integers; got {str(df[name].iloc[i])!r} in row {i}")
+    return values.astype(np.int32)
+
+
+_STRAND_CODES = {"+": 1, "-": -1, 1: 1, -1: -1}
+
+
+def _encode_strand(strand) -> np.ndarray:
+    values = []
+    for s in strand:
+        ok = isinstance(s, (str, int, np.integer)) and not isinstance(s, bool)
+        code = _STRAND_CODES.get(s) if ok else None
+        if code is None:
+            raise ValueError(f"Strand must be '+', '-', 1 or -1; got {s!r}")
+        values.append(code)
+    return np.asarray(values, dtype=np.int8)
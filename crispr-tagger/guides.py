@@ -1,5 +1,6 @@
 import re
 from sequence import fetch_region
+from guide_table import GuideTable
 
 def _revcomp(s: str) -> str:
     comp = str.maketrans("ACGTacgt", "TGCAtgca")
@@ -8,12 +9,12 @@ def _revcomp(s: str) -> str:
 def scan_ngg(chrom: str, center_genomic: int, half: int = 25):
     """
     Find N20-NGG (+strand) and CCN-N20 (-strand) within ±half around center.
-    Returns list of dicts: seq20, pam, strand, cut_genomic, distance
+    Returns a GuideTable with columns: seq20, pam, strand, cut_genomic, distance
     """
     win_start = max(1, center_genomic - half)
     win_end = center_genomic + half
     seq = fetch_region(chrom, win_start, win_end).upper()
-    out = []
+    seq20, pams, strands, cuts = [], [], [], []
 
     # + strand hits: N20 NGG
     for i in range(0, len(seq) - 23 + 1):
@@ -21,13 +22,10 @@ def scan_ngg(chrom: str, center_genomic: int, half: int = 25):
         pam = seq[i+20:i+23]
         if re.match(r"^[ACGT]{20}$", protospacer) and re.match(r"^[ACGT]GG$", pam):
             cut = (win_start + i + 20) - 3  # 3bp upstream of PAM on +
-            out.append({
-                "seq20": protospacer,
-                "pam": pam,
-                "strand": "+",
-                "cut_genomic": cut,
-                "distance": abs(cut - center_genomic),
-            })
+            seq20.append(protospacer)
+            pams.append(pam)
+            strands.append(1)
+            cuts.append(cut)
 
     # - strand hits: CCN (reverse PAM) then 20nt downstream → reverse-complement
     for i in range(0, len(seq) - 23 + 1):
@@ -38,13 +36,12 @@ def scan_ngg(chrom: str, center_genomic: int, half: int = 25):
                 protospacer = _revcomp(spacer_plus)
                 pam = _revcomp(pam_plus)
                 cut = (win_start + i) + 3  # 3bp upstream of PAM on - (in + coords)
-                out.append({
-                    "seq20": protospacer,
-                    "pam": pam,
-                    "strand": "-",
-                    "cut_genomic": cut,
-                    "distance": abs(cut - center_genomic),
-                })
+                seq20.append(protospacer)
+                pams.append(pam)
+                strands.append(-1)
+                cuts.append(cut)
 
+    distance = [abs(c - center_genomic) for c in cuts]
+    guides = GuideTable.from_lists(seq20, pams, strands, cuts, distance)
     # keep only guides whose cut site is within the window (paranoid check)
-    return [g for g in out if g["distance"] <= half]
\ No newline at end of file
+    return guides.filter(guides["distance"] <= half)
\ No newline at end of file
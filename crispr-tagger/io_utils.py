@@ -1,5 +1,6 @@
 # io_utils.py
 import csv
+from guide_table import GuideTable
 
 def write_fasta(path: str, header: str, seq: str):
     with open(path, "w") as fh:
@@ -8,19 +9,12 @@ def write_fasta(path: str, header: str, seq: str):
         for i in range(0, len(seq), 70):
             fh.write(seq[i:i+70] + "\n")
 
-def write_guides_csv(path: str, guides: list[dict]):
-    if not guides:
-        # create an empty file with headers
-        headers = ["seq20","pam","strand","cut_genomic","distance"]
-        with open(path, "w", newline="") as fh:
-            csv.writer(fh).writerow(headers)
-        return
-    headers = list(guides[0].keys())
-    with open(path, "w", newline="") as fh:
-        w = csv.DictWriter(fh, fieldnames=headers)
-        w.writeheader()
-        for row in guides:
-            w.writerow(row)
+def write_guides_csv(path: str, guides: GuideTable):
+    guides.to_csv(path)
+
+def write_guides_parquet(path: str, guides: GuideTable):
+    # needs pyarrow
+    guides.to_parquet(path)
             
             
 def write_primers_csv(path: str, primer_pairs: list[dict]):
@@ -33,9 +27,6 @@ def write_primers_csv(path: str, primer_pairs: list[dict]):
         for p in primer_pairs:
             w.writerow(p)
             
-def write_guides_fasta_for_crispor(path: str, chrom: str, guides: list[dict]):
+def write_guides_fasta_for_crispor(path: str, chrom: str, guides: GuideTable):
     # CRISPOR accepts multi-FASTA; we’ll name headers with locus info for easier merging
-    with open(path, "w") as fh:
-        for i, g in enumerate(guides, 1):
-            header = f"{chrom}|cut={g['cut_genomic']}|strand={g['strand']}|pam={g['pam']}"
-            fh.write(f">{header}\n{g['seq20']}\n")
\ No newline at end of file
+    guides.to_fasta_for_crispor(path, chrom)
\ No newline at end of file
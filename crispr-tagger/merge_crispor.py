@@ -1,6 +1,8 @@
 # merge_crispor.py
 import sys
+import numpy as np
 import pandas as pd
+from guide_table import GuideTable
 
 SEQ_CANDIDATES = [
     "seq20", "seq", "Guide Sequence", "Guide sequence", "guideSeq",
@@ -21,8 +23,38 @@ def pick_first(cols, candidates):
             return name
     return None
 
-def merge_crispor(guides_csv, crispor_tsv, out_scored, out_kept):
-    g = pd.read_csv(guides_csv)                      # our local guides
+GUIDE_SEQ_CANDIDATES = ["seq20", "seq", "sequence", "Spacer"]
+
+def read_guides_csv(guides_csv) -> GuideTable:
+    """
+    Load a local guides CSV (as written by write_guides_csv) into a GuideTable.
+    The sequence column may be named seq20/seq/sequence/Spacer; it must hold
+    20-nt ACGT protospacers, with pam/strand ('+'/'-')/cut_genomic/distance alongside.
+    """
+    g = pd.read_csv(guides_csv, dtype={"pam": str, "strand": str})
+    g_seq = pick_first(g.columns, GUIDE_SEQ_CANDIDATES)
+    if g_seq is None:
+        raise KeyError(f"Could not find a guide-sequence column in {guides_csv}. Got: {list(g.columns)}")
+    missing = [col for col in ["pam", "strand", "cut_genomic", "distance"] if col not in g.columns]
+    if missing:
+        raise KeyError(f"Missing columns {missing} in {guides_csv}. Got: {list(g.columns)}")
+
+    g["seq20"] = g[g_seq].astype(str).str.upper().str.replace(r"\s+", "", regex=True)
+    g["pam"] = g["pam"].astype(str).str.upper().str.strip()
+    g["strand"] = g["strand"].str.strip()
+    try:
+        return GuideTable.from_pandas(g)
+    except ValueError as e:
+        raise ValueError(f"Bad guide row in {guides_csv}: {e}") from e
+
+def merge_crispor(guides, crispor_tsv, out_scored=None, out_kept=None):
+    """
+    guides: GuideTable from scan_ngg (or a path to a guides CSV, see read_guides_csv).
+    Returns (scored, kept) GuideTables; also writes CSVs when out paths are given.
+    """
+    if not isinstance(guides, GuideTable):
+        guides = read_guides_csv(guides)
+    g = guides.to_pandas()                          # our local guides
     c = pd.read_csv(crispor_tsv, sep="\t")          # CRISPOR TSV
 
     
@@ -35,10 +67,6 @@ def merge_crispor(guides_csv, crispor_tsv, out_scored, out_kept):
     print(c.columns.tolist())
     print(c.head(3))
     # --- identify columns dynamically ---
-    g_seq = pick_first(g.columns, ["seq20", "seq", "sequence", "Spacer"])
-    if g_seq is None:
-        raise KeyError(f"Could not find a guide-sequence column in {guides_csv}. Got: {list(g.columns)}")
-
     c_seq = pick_first(c.columns, SEQ_CANDIDATES)
     if c_seq is None:
         # quick debug help
@@ -47,47 +75,44 @@ def merge_crispor(guides_csv, crispor_tsv, out_scored, out_kept):
     c_eff = pick_first(c.columns, EFF_CANDIDATES)   # may be None
     c_off = pick_first(c.columns, OFF01_CANDIDATES) # may be None
 
-    # --- normalize sequences for a robust join ---
-    g["_seq20_norm"] = g[g_seq].astype(str).str.upper().str.replace(r"\s+", "", regex=True)
-    c["_seq20_norm"] = c[c_seq].astype(str).str.upper().str.replace(r"\s+", "", regex=True)
-
-    merged = g.merge(c, on="_seq20_norm", how="left", suffixes=("", "_crispor"))
+    # --- normalize sequences for a robust join (ours are already clean uppercase) ---
+    c["seq20"] = c[c_seq].astype(str).str.upper().str.replace(r"\s+", "", regex=True)
+    g["_row"] = np.arange(len(g))
+    score_cols = [col for col in (c_eff, c_off) if col]
+    merged = g[["seq20", "_row"]].merge(c[["seq20"] + score_cols], on="seq20", how="left")
 
     # --- create unified columns ---
-    merged["seq20"] = merged[g_seq]
-    if c_eff:
-        merged["efficiency"] = pd.to_numeric(merged[c_eff], errors="coerce")
-    else:
-        merged["efficiency"] = pd.NA
-    if c_off:
-        # make it integer-like if possible
-        merged["off_le1mm"] = pd.to_numeric(merged[c_off], errors="coerce")
-    else:
-        merged["off_le1mm"] = pd.NA
+    def numeric(col):
+        if col is None:
+            return np.full(len(merged), np.nan)
+        return pd.to_numeric(merged[col], errors="coerce").to_numpy(
+            dtype=np.float64, na_value=np.nan, copy=True)
+
+    efficiency = numeric(c_eff)
+    off_le1mm = numeric(c_off)
 
     # flag the “self-hit counted as off-target” heuristic: off_le1mm == 1
-    merged["flag_selfhit"] = merged["off_le1mm"].fillna(-1).eq(1)
-    merged.loc[merged["flag_selfhit"], "off_le1mm"] = 0  # treat as zero for filtering
+    flag_selfhit = off_le1mm == 1
+    off_le1mm = np.where(flag_selfhit, 0.0, off_le1mm)  # treat as zero for filtering
+
+    # left join keeps every local guide (repeated if CRISPOR lists it twice)
+    scored = guides[merged["_row"].to_numpy()].with_scores(efficiency, off_le1mm, flag_selfhit)
 
     # --- filtering rules ---
-    eff_ok = merged["efficiency"].isna() | (merged["efficiency"] > 10)
-    off_ok = merged["off_le1mm"].isna() | (merged["off_le1mm"] == 0) | merged["flag_selfhit"]
-    kept = merged[eff_ok & off_ok].copy()
-
-    # tidy output
-    cols_order = [col for col in [
-        "seq20", "pam", "strand", "cut_genomic", "distance",
-        "efficiency", "off_le1mm", "flag_selfhit"
-    ] if col in merged.columns]
-    merged_out = merged[cols_order].copy()
-    kept_out   = kept[cols_order].copy()
-
-    merged_out.to_csv(out_scored, index=False)
-    kept_out.to_csv(out_kept, index=False)
-    print(f"Scored: {len(merged_out)}, kept: {len(kept_out)}")
+    eff_ok = np.isnan(efficiency) | (efficiency > 10)
+    off_ok = np.isnan(off_le1mm) | (off_le1mm == 0) | flag_selfhit
+    kept = scored.filter(eff_ok & off_ok)
+
+    if out_scored:
+        scored.to_csv(out_scored)
+    if out_kept:
+        kept.to_csv(out_kept)
+    print(f"Scored: {len(scored)}, kept: {len(kept)}")
+    return scored, kept
 
 if __name__ == "__main__":
     if len(sys.argv) < 5:
         print("Usage: python merge_crispor.py <guides_csv> <crispor_tsv> <out_scored> <out_kept>")
+        print("  guides_csv: seq20 (or seq/sequence/Spacer, 20-nt ACGT), pam, strand (+/-), cut_genomic, distance")
         sys.exit(1)
     merge_crispor(sys.argv[1], sys.argv[2], sys.argv[3], sys.argv[4])
\ No newline at end of file
@@ -6,11 +6,11 @@ from guides import scan_ngg
 from donor import build_donor
 from sequence import get_amplicon_window
 from primers import design_primers_centered
+from merge_crispor import merge_crispor
 from io_utils import write_fasta, write_guides_csv, write_primers_csv, write_guides_fasta_for_crispor
 
 # import the callable we just added
 from auto_crispor import run_auto_crispor
-from subprocess import run, CalledProcessError
 
 def main():
     # --- Inputs ---
@@ -75,17 +75,11 @@ def main():
     out_scored = f"{out_prefix}_sgRNAs_scored.csv"
     out_kept   = f"{out_prefix}_sgRNAs_kept.csv"
     try:
-        # call merge script via CLI so it stays decoupled
-        run([
-            sys.executable, "merge_crispor.py",
-            f"{out_prefix}_sgRNAs.csv",
-            tsv_path,
-            out_scored,
-            out_kept
-        ], check=True)
+        # guides stay in memory; the CSVs are only written as outputs
+        merge_crispor(guides, tsv_path, out_scored, out_kept)
         print(f"\nWrote: {out_scored}\nWrote: {out_kept}")
-    except CalledProcessError as e:
-        print("merge_crispor.py failed:", e)
+    except (KeyError, ValueError, OSError) as e:
+        print("merge_crispor failed:", e)
         sys.exit(3)
 
     print("\nAll done.")